@@ -1,5 +1,6 @@
 import numpy as np
-from scipy import stats
+
+from pyRiskTable.lognormal import lognorm_cdf
 
 from pyRiskTable.example.constants import PGA_S, PGA_M, PGA_E, PGA_C, PGA_SIGMA
 from pyRiskTable.example.constants import PGD_S, PGD_M, PGD_E, PGD_C, PGD_SIGMA
@@ -23,13 +24,13 @@ def fragility_curve(damage_state='s', scale=1.0):
     median_c = scale*PGA_C
     
     if damage_state.lower() in ('s', 'slight'):
-        func = lambda im: stats.lognorm.cdf(im, PGA_SIGMA, scale=median_s)
+        func = lambda im: lognorm_cdf(im, PGA_SIGMA, scale=median_s)
     elif damage_state.lower() in ('m', 'moderate'):
-        func = lambda im: stats.lognorm.cdf(im, PGA_SIGMA, scale=median_m)
+        func = lambda im: lognorm_cdf(im, PGA_SIGMA, scale=median_m)
     elif damage_state.lower() in ('e', 'extensive'):
-        func = lambda im: stats.lognorm.cdf(im, PGA_SIGMA, scale=median_e)
+        func = lambda im: lognorm_cdf(im, PGA_SIGMA, scale=median_e)
     elif damage_state.lower() in ('c', 'complete', 'collapse'):
-        func = lambda im: stats.lognorm.cdf(im, PGA_SIGMA, scale=median_c)
+        func = lambda im: lognorm_cdf(im, PGA_SIGMA, scale=median_c)
     
     return func
 
@@ -47,12 +48,12 @@ def fragility_curve_second(damage_state='s', scale=1.0):
     """
 
     if damage_state.lower() in ('s', 'slight'):
-        func = lambda im: stats.lognorm.cdf(im, PGD_SIGMA, scale=PGD_S)
+        func = lambda im: lognorm_cdf(im, PGD_SIGMA, scale=PGD_S)
     elif damage_state.lower() in ('m', 'moderate'):
-        func = lambda im: stats.lognorm.cdf(im, PGD_SIGMA, scale=PGD_M)
+        func = lambda im: lognorm_cdf(im, PGD_SIGMA, scale=PGD_M)
     elif damage_state.lower() in ('e', 'extensive'):
-        func = lambda im: stats.lognorm.cdf(im, PGD_SIGMA, scale=PGD_E)
+        func = lambda im: lognorm_cdf(im, PGD_SIGMA, scale=PGD_E)
     elif damage_state.lower() in ('c', 'complete', 'collapse'):
-        func = lambda im: stats.lognorm.cdf(im, PGD_SIGMA, scale=PGD_C)
+        func = lambda im: lognorm_cdf(im, PGD_SIGMA, scale=PGD_C)
     
     return func
\ No newline at end of file
@@ -1,13 +1,24 @@
 import numpy as np
 import math as mt
-from scipy import stats
+
+from pyRiskTable.lognormal import SQRT_2PI, lognorm_cdf, lognorm_pdf, lognorm_ppf
 
 from pyRiskTable.example.constants import RATE, M_HAZARD, R_HAZARD, SIGMA_HAZARD
 from pyRiskTable.example.constants import PGD_SIGMA, LQ_CLASS, WATER_DEPTH
 
+try:
+    from numba import njit
+except ImportError:    # numba is optional; numpy implementations are used without it
+    njit = None
+
 
 # example hazard curve
 
+# median PGA of the example hazard (ground motion model in Baker (2013), section 2.3)
+_LN_MEDIAN = -0.152 + 0.859*M_HAZARD - 1.803*mt.log(R_HAZARD+25)
+_MEDIAN = mt.exp(_LN_MEDIAN)
+
+
 def hazard_curve(im):
     """Example hazard curve based on Baker (2013), section 2.3.
 
@@ -18,9 +29,7 @@ def hazard_curve(im):
         hazard_rate (float or 1D array): annual rate of exceedance of the hazard curve
     """
     
-    ln_median = -0.152 + 0.859*M_HAZARD - 1.803*mt.log(R_HAZARD+25)
-
-    hazard_rate = RATE*(1-stats.lognorm.cdf(im, SIGMA_HAZARD, scale=mt.exp(ln_median)))
+    hazard_rate = RATE*(1-lognorm_cdf(im, SIGMA_HAZARD, scale=_MEDIAN))
 
     return hazard_rate
 
@@ -36,9 +45,7 @@ def hazard_likelihood(im):
         hazard_like (float or 1D array): hazard likelihood(s) at IM(s)
     """
 
-    ln_median = -0.152 + 0.859*M_HAZARD - 1.803*mt.log(R_HAZARD+25)
-
-    hazard_like = RATE*stats.lognorm.pdf(im, SIGMA_HAZARD, scale=mt.exp(ln_median))
+    hazard_like = RATE*lognorm_pdf(im, SIGMA_HAZARD, scale=_MEDIAN)
 
     return hazard_like
 
@@ -53,9 +60,7 @@ def inv_hazard_curve(prob):
         im (float or array): IMs at the annual rates
     """
 
-    ln_median = -0.152 + 0.859*M_HAZARD - 1.803*mt.log(R_HAZARD+25)
-
-    im = stats.lognorm.ppf(1-prob/RATE, SIGMA_HAZARD, scale=mt.exp(ln_median))
+    im = lognorm_ppf(1-prob/RATE, SIGMA_HAZARD, scale=_MEDIAN)
 
     return im
 
@@ -80,13 +85,13 @@ def second_probability(im1, sc=LQ_CLASS, magnitude=M_HAZARD, water_depth=WATER_D
         im1 = im1[np.newaxis]   # Makes scalar im_a 1D array
         scalar_input = True
 
-    lq_probability = {
-        5: lambda a: 9.09*a - 0.82,
-        4: lambda a: 7.67*a - 0.92,
-        3: lambda a: 6.67*a - 1.00,
-        2: lambda a: 5.57*a - 1.18,
-        1: lambda a: 4.16*a - 1.08,
-        0: lambda a: 0,
+    lq_probability = {    # (slope, intercept) of the linear function of PGA
+        5: (9.09, -0.82),
+        4: (7.67, -0.92),
+        3: (6.67, -1.00),
+        2: (5.57, -1.18),
+        1: (4.16, -1.08),
+        0: (0.0, 0.0),
     }
     lq_pml = {5: 0.25, 4: 0.20, 3: 0.10, 2: 0.05, 1: 0.02, 0: 0}
 
@@ -94,13 +99,19 @@ def second_probability(im1, sc=LQ_CLASS, magnitude=M_HAZARD, water_depth=WATER_D
     kM = 0.0027*M**3 - 0.0267*M**2 - 0.2055*M + 2.9188
     kw = 0.022*dw + 0.93
 
-    p_standard = lq_probability[sc](im1)
-    p_standard[p_standard<0] = 0.0
-    p_standard[p_standard>1] = 1.0
+    slope, intercept = lq_probability[sc]
+
+    if _lq_prob_kernel is not None:
+        # the kernel loops over a 1D array
+        prob_lq = _lq_prob_kernel(im1.astype(np.float64).ravel(), slope, intercept, lq_pml[sc] / (kM*kw))
+        prob_lq = prob_lq.reshape(im1.shape)
+    else:
+        p_standard = np.clip(slope*im1 + intercept, 0.0, 1.0)
 
-    prob_lq = p_standard / (kM*kw) * lq_pml[sc]
-    prob_lq[prob_lq<0] = 0.0
-    prob_lq[prob_lq>1] = 1.0
+        # reuse the buffer of p_standard: one multiply and one clip
+        prob_lq = p_standard
+        prob_lq *= lq_pml[sc] / (kM*kw)
+        np.clip(prob_lq, 0.0, 1.0, out=prob_lq)
 
     if scalar_input:
         return prob_lq[0]
@@ -140,27 +151,20 @@ def d_second_hazard_curve(im1, im2, sc=LQ_CLASS, magnitude=M_HAZARD, sigma=PGD_S
     M = magnitude
     kdelta = 0.0086*M**3 - 0.0914*M**2 + 0.4698*M - 0.9835
 
-    x = im1 / PGA_trigger[sc]
-    PGD_standard = np.zeros_like(x)
-
-    mask0 = x<1
-    mask1 = (x>=1) & (x<2)
-    mask2 = (x>=2) & (x<3)
-    mask3 = x>=3
+    if _pgd_pdf_kernel is not None:
+        # the kernel loops over 1D arrays
+        im2_pdf = _pgd_pdf_kernel(im1.astype(np.float64).ravel(), im2.astype(np.float64).ravel(),
+                                  PGA_trigger[sc], kdelta, sigma)
+        im2_pdf = im2_pdf.reshape(im2.shape)
+    else:
+        x = im1 / PGA_trigger[sc]
+        PGD_standard = np.select([x<1, x<2, x<3], [0, 12*x - 12, 18*x - 24], default=70*x - 180)
 
-    PGD_standard[mask0] = 0
-    PGD_standard[mask1] = 12*x[mask1] -12
-    PGD_standard[mask2] = 18*x[mask2] - 24
-    PGD_standard[mask3] = 70*x[mask3] - 180
+        PGD_median = kdelta * PGD_standard
 
-    PGD_median = kdelta * PGD_standard
-
-    im2_pdf = np.zeros_like(im2)
-    for i, (im, pgd) in enumerate(zip(im2, PGD_median)):
-        if pgd == 0:
-            im2_pdf[i] = 0
-        else:
-            im2_pdf[i] = stats.lognorm.pdf(im, sigma, scale=pgd)
+        im2_pdf = np.zeros_like(im2, dtype=float)
+        nonzero = PGD_median > 0
+        im2_pdf[nonzero] = lognorm_pdf(im2[nonzero], sigma, scale=PGD_median[nonzero])
     
     if scalar_input:
         return im2_pdf[0]
@@ -168,6 +172,44 @@ def d_second_hazard_curve(im1, im2, sc=LQ_CLASS, magnitude=M_HAZARD, sigma=PGD_S
     return im2_pdf
 
 
+def _lq_prob_loop(im1, slope, intercept, factor):
+    """Single-pass version of the clipped liquefaction probability in `second_probability`."""
+    prob_lq = np.empty_like(im1)
+    for i in range(im1.shape[0]):
+        p_standard = min(max(slope*im1[i] + intercept, 0.0), 1.0)
+        prob_lq[i] = min(max(p_standard * factor, 0.0), 1.0)
+    return prob_lq
+
+
+def _pgd_pdf_loop(im1, im2, pga_trigger, kdelta, sigma):
+    """Single-pass version of the piecewise PGD model and its lognormal PDF in `d_second_hazard_curve`."""
+    im2_pdf = np.zeros_like(im2)
+    for i in range(im1.shape[0]):
+        x = im1[i] / pga_trigger
+        if x < 1:
+            continue
+        elif x < 2:
+            pgd = kdelta * (12*x - 12)
+        elif x < 3:
+            pgd = kdelta * (18*x - 24)
+        else:
+            pgd = kdelta * (70*x - 180)
+        # PDF is zero outside the support of the lognormal distribution
+        if pgd > 0 and im2[i] > 0:
+            z = mt.log(im2[i]/pgd)/sigma
+            im2_pdf[i] = mt.exp(-0.5*z*z) / (im2[i]*sigma*SQRT_2PI)
+    return im2_pdf
+
+
+# the loop kernels only pay off when compiled
+if njit is not None:
+    _lq_prob_kernel = njit(cache=True)(_lq_prob_loop)
+    _pgd_pdf_kernel = njit(cache=True)(_pgd_pdf_loop)
+else:
+    _lq_prob_kernel = None
+    _pgd_pdf_kernel = None
+
+
 def im2d_likelihood(im1, im2, sc=LQ_CLASS, magnitude=M_HAZARD, water_depth=WATER_DEPTH, sigma=PGD_SIGMA):
     """Return the likelihood of the joint event of IM1=im_1 and IM2=im_2
     where IM1 and IM2 are the IMs of primary and secondary hazards.
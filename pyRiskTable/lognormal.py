@@ -0,0 +1,66 @@
+import math as mt
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+
+SQRT_2PI = mt.sqrt(2*mt.pi)
+
+
+# closed-form lognormal functions (same parameterization as `scipy.stats.lognorm`)
+# that skip the overhead of the `scipy.stats` distribution infrastructure
+
+def _support(x):
+    """Mask of x > 0 and x with values outside the support replaced by 1.0 (safe for log)."""
+    x = np.asarray(x, dtype=np.float64)
+    in_support = x > 0
+    return in_support, np.where(in_support, x, 1.0)
+
+
+def lognorm_cdf(x, s, scale=1.0):
+    """CDF of lognormal distribution.
+
+    Args:
+        x (float or array): values of the random variable
+        s (float): dispersion (standard deviation of the underlying normal distribution)
+        scale (float or array, optional): median. Defaults to 1.0.
+
+    Returns:
+        cdf (float or array): CDF values at x. Zero for x <= 0
+    """
+
+    in_support, x = _support(x)
+
+    return np.where(in_support, ndtr(np.log(x/scale)/s), 0.0)[()]
+
+
+def lognorm_pdf(x, s, scale=1.0):
+    """PDF of lognormal distribution.
+
+    Args:
+        x (float or array): values of the random variable
+        s (float): dispersion (standard deviation of the underlying normal distribution)
+        scale (float or array, optional): median. Defaults to 1.0.
+
+    Returns:
+        pdf (float or array): PDF values at x. Zero for x <= 0
+    """
+
+    in_support, x = _support(x)
+    z = np.log(x/scale)/s
+
+    return np.where(in_support, np.exp(-0.5*z**2) / (x*s*SQRT_2PI), 0.0)[()]
+
+
+def lognorm_ppf(q, s, scale=1.0):
+    """Inverse CDF of lognormal distribution.
+
+    Args:
+        q (float or array): non-exceedance probabilities
+        s (float): dispersion (standard deviation of the underlying normal distribution)
+        scale (float or array, optional): median. Defaults to 1.0.
+
+    Returns:
+        x (float or array): values of the random variable at q
+    """
+
+    return scale*np.exp(s*ndtri(q))
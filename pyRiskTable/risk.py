@@ -1,5 +1,7 @@
 import numpy as np
 
+from pyRiskTable.lognormal import lognorm_cdf
+
 
 def expected_consequence(im, fragility_funcs=None, cq_array=None):
     """Expected consequences given IM(s)
@@ -16,10 +18,54 @@ def expected_consequence(im, fragility_funcs=None, cq_array=None):
     assert fragility_funcs is not None, "Must provide a list of fragility functions"
     assert len(fragility_funcs) == len(cq_array), f"fragility_funcs and cq_array must have the same length"
 
-    cdf_array = np.array([func(im) for func in fragility_funcs])
-    prob_array = -np.diff(cdf_array, axis=0, append=0)
+    cdf_array = np.empty((len(fragility_funcs),) + np.shape(im))
+    for i, func in enumerate(fragility_funcs):
+        cdf_array[i] = func(im)
+
+    # sum_i (P_i - P_{i+1}) * cq_i == sum_i P_i * (cq_i - cq_{i-1})
+    dcq_array = np.diff(cq_array, prepend=0)
+    risk = dcq_array @ cdf_array
+
+    return risk
+
+
+def lognormal_expected_consequence(im, medians=None, dispersion=None, cq_array=None):
+    """Expected consequences given IM(s) for lognormal fragility curves sharing the same dispersion.
+    All damage states are evaluated in one vectorized pass instead of one fragility function per damage state.
+    Leading dimensions are broadcast, so multiple assets (e.g., bridges) can be evaluated in one call.
+
+    Args:
+        im (float, 1D or 2D array): IM values. Use shape (n_asset, n_im) for multiple assets
+        medians (1D or 2D array): medians of fragility curves organized in the order of S, M, E, C damage states.
+            Use shape (n_asset, n_ds) for multiple assets
+        dispersion (float or 1D array): dispersion of fragility curves. Use shape (n_asset,) for multiple assets
+        cq_array (1D or 2D array): array of DS-dependent consequences organized in the order of S, M, E, C damage states.
+            Use shape (n_asset, n_ds) for multiple assets
+
+    Returns:
+        risk (float, 1D or 2D array): expected consequences at IM(s)
+    """
+
+    assert medians is not None, "Must provide medians of fragility curves"
+    assert dispersion is not None, "Must provide dispersion of fragility curves"
+
+    medians = np.asarray(medians)
+    cq_array = np.asarray(cq_array)
+    assert medians.shape[-1] == cq_array.shape[-1], f"medians and cq_array must have the same length"
+
+    im = np.asarray(im)
+    scalar_input = im.ndim == 0
+
+    cdf_array = lognorm_cdf(np.atleast_1d(im)[..., np.newaxis],
+                            np.asarray(dispersion)[..., np.newaxis, np.newaxis],
+                            scale=medians[..., np.newaxis, :])
+    # sum_i (P_i - P_{i+1}) * cq_i == sum_i P_i * (cq_i - cq_{i-1})
+    dcq_array = np.diff(cq_array, axis=-1, prepend=0)
+    risk = (cdf_array @ dcq_array[..., np.newaxis])[..., 0]
 
-    risk = prob_array.T @ cq_array
+    if scalar_input:
+        # drop the IM axis only; the asset axis (if any) is kept
+        return risk[..., 0][()]
 
     return risk
 
@@ -1,5 +1,6 @@
 import warnings
 import numpy as np
+from functools import lru_cache
 from scipy.special import roots_legendre
 
 
@@ -7,6 +8,79 @@ class _AccuracyWarning(Warning):
     pass
 
 
+@lru_cache(maxsize=128)
+def _cached_roots(n):
+    """Gauss-Legendre points and weights of order n (cached, read-only)."""
+    x, w = roots_legendre(n)
+    x = np.real(x).astype(np.float64)
+    w = np.asarray(w, dtype=np.float64)
+    x.setflags(write=False)
+    w.setflags(write=False)
+    return x, w
+
+
+def _legendre_grid(n, a, b, c, d):
+    """Flattened 2D Gauss-Legendre points and weights of order n on [a, b] x [c, d].
+    Only the 1D roots are cached; the grid is rebuilt so that callers get their own (writable) arrays."""
+    pts, pts_w = _cached_roots(n)
+
+    im1 = (b-a)*(pts+1)/2.0+a
+    im2 = (d-c)*(pts+1)/2.0+c
+    im1, im2 = np.meshgrid(im1, im2)
+    im1 = im1.ravel()
+    im2 = im2.ravel()
+
+    w1 = (b-a)/2.0 * pts_w
+    w2 = (d-c)/2.0 * pts_w
+    w1, w2 = np.meshgrid(w1, w2)
+    w1 = w1.ravel()
+    w2 = w2.ravel()
+
+    return im1, im2, w1, w2
+
+
+def _vectorize(func, kwargs, vectorized=False):
+    """Wrap `func` with its keyword arguments so that it takes 1D array input(s).
+
+    If `vectorized` is False, `func` is still tried with array input(s) on the first call. Element-wise
+    evaluation is only used (for all later calls) when `func` raises TypeError/ValueError on arrays or does
+    not return one value per input. In the latter case, the first call evaluates `func` twice.
+    """
+
+    if vectorized:
+        return lambda *ims: func(*ims, **kwargs)
+
+    is_vectorized = []
+
+    def elementwise(*ims):
+        return np.array([func(*im, **kwargs) for im in zip(*ims)])
+
+    def vfunc(*ims):
+        if is_vectorized:
+            return func(*ims, **kwargs) if is_vectorized[0] else elementwise(*ims)
+
+        array_error = None
+        try:
+            out = func(*ims, **kwargs)
+        except (TypeError, ValueError) as e:
+            array_error = e
+        else:
+            if np.shape(out) == np.shape(ims[0]):
+                is_vectorized.append(True)
+                return out
+
+        try:
+            out = elementwise(*ims)
+        except Exception as e:
+            # report why the array call failed as well
+            raise e from array_error
+
+        is_vectorized.append(False)
+        return out
+
+    return vfunc
+
+
 def generate_primary_event(a, b, likelihood_func=None, kw_likelihood={}, vec_likelihood=False,
                            consequence_func=None, kw_consequence={}, vec_consequence=False,
                            tol=1e-8, rtol=1e-8, min_order=1, max_order=50):
@@ -18,10 +92,10 @@ def generate_primary_event(a, b, likelihood_func=None, kw_likelihood={}, vec_lik
         b (float): upper limit of IM level under consideration.
         likelihood_func (function): hazard likelihood function.
         kw_likelihood (dict, optional): keyward arguments of `likelihood_func`. Defaults to {}.
-        vec_likelihood (bool, optional): Whether `likelihood_func` accepts 1D array input. Defaults to False.
+        vec_likelihood (bool, optional): Whether `likelihood_func` accepts 1D array input. If False, array support is detected on the first call. Defaults to False.
         consequene_func (function): **expected** consequene function.
         kw_consequene (dict, optional): keyward arguments of `consequene_func`. Defaults to {}.
-        vec_consequene (bool, optional): Whether `consequene_func` accepts 1D array input. Defaults to False.
+        vec_consequene (bool, optional): Whether `consequene_func` accepts 1D array input. If False, array support is detected on the first call. Defaults to False.
         tol (float, optional): tolerance on integral difference between consecutive integration points. Defaults to 1e-8.
         rtol (float, optional): relative tolerance on integral difference between consecutive integration points. Defaults to 1e-8.
         min_order (int, optional): minimum Gauss-Legendre order (inclusive). Defaults to 1.
@@ -38,21 +112,26 @@ def generate_primary_event(a, b, likelihood_func=None, kw_likelihood={}, vec_lik
     assert likelihood_func is not None, "Must provide likelihood_func"
     assert consequence_func is not None, "Must provide consequence_func"
 
-    if vec_likelihood:
-        likelihood_vfunc = lambda im: likelihood_func(im, **kw_likelihood)
-    else:
-        likelihood_vfunc = np.vectorize(lambda im: likelihood_func(im, **kw_likelihood))
+    likelihood_vfunc = _vectorize(likelihood_func, kw_likelihood, vec_likelihood)
+    consequence_vfunc = _vectorize(consequence_func, kw_consequence, vec_consequence)
 
-    if vec_consequence:
-        consequence_vfunc = lambda im: consequence_func(im, **kw_consequence)
-    else:
-        consequence_vfunc = np.vectorize(lambda im: consequence_func(im, **kw_consequence))
+    if min_order == max_order:
+        # fixed order: no refinement, and no error estimate is available
+        x, w = _cached_roots(min_order)
+
+        ims = (b-a)*(x+1)/2.0+a
+        scalers = (b-a)/2.0 * w
+
+        likes = likelihood_vfunc(ims)
+        cqs = consequence_vfunc(ims)
+        val = np.sum(scalers*likes*cqs, axis=-1)
+
+        return ims, scalers, likes, cqs, val, np.inf
 
     val = np.inf
     err = np.inf
     for n in range(min_order, max_order+1):
-        x, w = roots_legendre(n)
-        x = np.real(x)
+        x, w = _cached_roots(n)
 
         ims = (b-a)*(x+1)/2.0+a
         scalers = (b-a)/2.0 * w
@@ -74,6 +153,46 @@ def generate_primary_event(a, b, likelihood_func=None, kw_likelihood={}, vec_lik
 
 
 
+def generate_primary_events(a, b, likelihood_func=None, kw_likelihood={},
+                            consequence_func=None, kw_consequence={}, order=10):
+    """Conduct fixed-order Gauss-Legendre quadrature for a batch of primary events (e.g., one per bridge) at once.
+    Unlike `generate_primary_event`, there is no refinement of the order, so that all events share the same
+    number of integration points.
+
+    Args:
+        a (1D array): lower limits of IM levels under consideration, one per event.
+        b (1D array): upper limits of IM levels under consideration, one per event.
+        likelihood_func (function): hazard likelihood function. Must accept a 2D array of IMs (events x points).
+        kw_likelihood (dict, optional): keyward arguments of `likelihood_func`. Defaults to {}.
+        consequene_func (function): **expected** consequene function. Must accept a 2D array of IMs (events x points).
+        kw_consequene (dict, optional): keyward arguments of `consequene_func`. Defaults to {}.
+        order (int, optional): Gauss-Legendre order. Defaults to 10.
+
+    Returns:
+        ims (2D array): IM levels for risk approximation (one row per event)
+        scalers (2D array): weights to scale the consequences
+        likes (2D array): hazard likelihoods at IMs
+        cqs (2D array): expected consequences at IMs
+        vals (1D array): approximated risk values
+    """
+    assert likelihood_func is not None, "Must provide likelihood_func"
+    assert consequence_func is not None, "Must provide consequence_func"
+
+    a = np.asarray(a, dtype=np.float64)[:, np.newaxis]
+    b = np.asarray(b, dtype=np.float64)[:, np.newaxis]
+
+    x, w = _cached_roots(order)
+
+    ims = (b-a)*(x+1)/2.0+a
+    scalers = (b-a)/2.0 * w
+
+    likes = likelihood_func(ims, **kw_likelihood)
+    cqs = consequence_func(ims, **kw_consequence)
+    vals = np.sum(scalers*likes*cqs, axis=-1)
+
+    return ims, scalers, likes, cqs, vals
+
+
 def generate_secondary_event(a, b, c, d, likelihood_func=None, kw_likelihood={}, vec_likelihood=False,
                              consequence_func=None, kw_consequence={}, vec_consequence=False,
                              tol=1e-8, rtol=1e-8, min_order=1, max_order=50):
@@ -88,10 +207,10 @@ def generate_secondary_event(a, b, c, d, likelihood_func=None, kw_likelihood={},
         d (float): upper limit of secondary IM level under consideration.
         likelihood_func (function): hazard likelihood function. Must take two arguments, IM of primary and IM of secondary
         kw_likelihood (dict, optional): keyward arguments of `likelihood_func`. Defaults to {}.
-        vec_likelihood (bool, optional): Whether `likelihood_func` accepts 1D array input. Defaults to False.
+        vec_likelihood (bool, optional): Whether `likelihood_func` accepts 1D array input. If False, array support is detected on the first call. Defaults to False.
         consequene_func (function): **expected** consequene function.
         kw_consequene (dict, optional): keyward arguments of `consequene_func`. Defaults to {}.
-        vec_consequene (bool, optional): Whether `consequene_func` accepts 1D array input. Defaults to False.
+        vec_consequene (bool, optional): Whether `consequene_func` accepts 1D array input. If False, array support is detected on the first call. Defaults to False.
         tol (float, optional): tolerance on integral difference between consecutive integration points. Defaults to 1e-8.
         rtol (float, optional): relative tolerance on integral difference between consecutive integration points. Defaults to 1e-8.
         min_order (int, optional): minimum Gauss-Legendre order (inclusive). Defaults to 1.
@@ -109,39 +228,18 @@ def generate_secondary_event(a, b, c, d, likelihood_func=None, kw_likelihood={},
     assert likelihood_func is not None, "Must provide likelihood_func"
     assert consequence_func is not None, "Must provide consequence_func"
 
-    if vec_likelihood:
-        likelihood_vfunc = lambda im1, im2: likelihood_func(im1, im2, **kw_likelihood)
-    else:
-        likelihood_vfunc = np.vectorize(lambda im1, im2: likelihood_func(im1, im2, **kw_likelihood))
-
-    if vec_consequence:
-        consequence_vfunc = lambda im: consequence_func(im, **kw_consequence)
-    else:
-        consequence_vfunc = np.vectorize(lambda im: consequence_func(im, **kw_consequence))
+    likelihood_vfunc = _vectorize(likelihood_func, kw_likelihood, vec_likelihood)
+    consequence_vfunc = _vectorize(consequence_func, kw_consequence, vec_consequence)
 
     val = np.inf
     err = np.inf
     for n in range(min_order, max_order+1):
-        pts1, pts1_w = roots_legendre(n)
-        pts1 = np.real(pts1)
-        pts2, pts2_w = pts1, pts1_w
-
-        im1 = (b-a)*(pts1+1)/2.0+a
-        im2 = (d-c)*(pts2+1)/2.0+c
-        im1, im2 = np.meshgrid(im1, im2)
-        im1 = im1.ravel()
-        im2 = im2.ravel()
-
-        w1 = (b-a)/2.0 * pts1_w
-        w2 = (d-c)/2.0 * pts2_w
-        w1, w2 = np.meshgrid(w1, w2)
-        w1 = w1.ravel()
-        w2 = w2.ravel()
+        im1, im2, w1, w2 = _legendre_grid(n, a, b, c, d)
 
         # Jdet = (b-a)*(d-c)/4.0
 
-        cqs = consequence_func(im2, **kw_consequence)
-        likes = likelihood_func(im1, im2, **kw_likelihood)
+        cqs = consequence_vfunc(im2)
+        likes = likelihood_vfunc(im1, im2)
         newval = np.sum(w1*w2*likes*cqs, axis=-1)
 
         err = abs(newval-val)
@@ -4,19 +4,21 @@
 
 import pandas as pd
 import numpy as np
-import scipy.stats as stats
 import scipy.interpolate as intp
+
+from pyRiskTable.lognormal import lognorm_cdf
  
  
 def export_primary_scenarios(ims=None, scalers=None, likes=None, cqs=None,
                              hazard_curve=None, vec_func=False,
                              filepath=None):
 
-    scenario_df = pd.DataFrame()
-    scenario_df['Likelihood'] = likes
-    scenario_df['Intensity'] = ims
-    scenario_df['Consequences'] = cqs
-    scenario_df['Weights'] = scalers
+    scenario_dict = {
+        'Likelihood': likes,
+        'Intensity': ims,
+        'Consequences': cqs,
+        'Weights': scalers,
+    }
 
     if hazard_curve is not None:
         if vec_func:
@@ -25,7 +27,10 @@ def export_primary_scenarios(ims=None, scalers=None, likes=None, cqs=None,
             vfunc = np.vectorize(hazard_curve)
             
         rates = vfunc(ims)
-        scenario_df['Return Period'] = 1/rates
+        scenario_dict['Return Period'] = 1/rates
+
+    # build the table in one go instead of inserting columns one at a time
+    scenario_df = pd.DataFrame(scenario_dict)
     
     if filepath is None:
         filepath = "tmp.csv"
@@ -60,25 +65,33 @@ def user_hazard_likelihood(
 
     assert filepath is not None, "Must provide filepath"
 
-    # check if filepath is a path or a dataframe
+    # check if filepath is a path, a dataframe, or a tuple of (im, likelihood/exceedence) arrays
     if isinstance(filepath, str):
         hazard_df = pd.read_csv(filepath)
-        im_arr, like_arr = hazard_df[im_key].values, hazard_df[like_key].values
+        im_arr, like_arr = hazard_df[im_key].to_numpy(), hazard_df[like_key].to_numpy()
     elif isinstance(filepath, pd.DataFrame):
-        im_arr, like_arr = filepath[im_key].values, filepath[like_key].values
+        im_arr, like_arr = filepath[im_key].to_numpy(), filepath[like_key].to_numpy()
+    elif isinstance(filepath, tuple) and len(filepath) == 2:
+        im_arr, like_arr = filepath
     else:
         raise ValueError(f"Invalid filepath={filepath}")
 
+    # close over contiguous float arrays instead of the dataframe
+    im_arr = np.ascontiguousarray(im_arr, dtype=np.float64)
+    like_arr = np.ascontiguousarray(like_arr, dtype=np.float64)
+
     # drop nan values
     im_arr, like_arr = im_arr[~np.isnan(like_arr)], like_arr[~np.isnan(like_arr)]
+
+    # interpolation requires increasing IMs: check once here rather than in the returned function
+    assert np.all(np.diff(im_arr) > 0), "IMs must be in strictly increasing order"
     
     if like_type == 'likelihood' and method == 'linear':
         func = lambda im: np.interp(im, im_arr, like_arr, **intp_kwgs)
 
     elif like_type == 'likelihood' and method == 'cubic_spline':
-        res = intp.CubicSpline(im_arr, like_arr, **intp_kwgs)
         # take value at im
-        func = lambda im: res(im)
+        func = intp.CubicSpline(im_arr, like_arr, **intp_kwgs)
 
     elif like_type == 'exceedence' and method == 'linear':
         # use numerical differentitation to compute likelihood
@@ -91,13 +104,18 @@ def user_hazard_likelihood(
         if space == 'linear':
             res = intp.CubicSpline(im_arr, exceed_arr, **intp_kwgs)
             # take the derivative of res
-            func = lambda im: -res.derivative()(im)
+            res_p = res.derivative()
+            func = lambda im: -res_p(im)
         elif space == 'log':
-            res = intp.CubicSpline(np.log(im_arr), np.log(exceed_arr), **intp_kwgs)
+            # breakpoints are transformed to log space once
+            log_im_arr, log_exceed_arr = np.log(im_arr), np.log(exceed_arr)
+            res = intp.CubicSpline(log_im_arr, log_exceed_arr, **intp_kwgs)
+            res_p = res.derivative()
             # take the derivative of res and transform back to linear space
             def func(im):
-                log_f = res(np.log(im))
-                log_fp = res.derivative()(np.log(im))
+                log_im = np.log(im)
+                log_f = res(log_im)
+                log_fp = res_p(log_im)
                 like = -np.exp(log_f) / im * log_fp
                 return like
         else:
@@ -114,14 +132,16 @@ def user_fragility_curve(filepath=None, im_key='IM', ds_key='Slight'):
     assert filepath is not None, "Must provide filepath"
 
     fragility_df = pd.read_csv(filepath)
+    im_arr = np.ascontiguousarray(fragility_df[im_key].to_numpy(dtype=np.float64))
+    cdf_arr = np.ascontiguousarray(fragility_df[ds_key].to_numpy(dtype=np.float64))
     
-    func = lambda im: np.interp(im, fragility_df[im_key], fragility_df[ds_key])
+    func = lambda im: np.interp(im, im_arr, cdf_arr)
     
     return func
 
 
 def fragility_curve(median, dispersion):
 
-    func = lambda im: stats.lognorm.cdf(im, dispersion, scale=median)
+    func = lambda im: lognorm_cdf(im, dispersion, scale=median)
 
     return func
\ No newline at end of file
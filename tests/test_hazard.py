@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import pyRiskTable.example.hazard as hazard
+
+
+# compiled kernels when numba is installed, otherwise the plain loops (same logic)
+LQ_KERNEL = hazard._lq_prob_kernel or hazard._lq_prob_loop
+PGD_KERNEL = hazard._pgd_pdf_kernel or hazard._pgd_pdf_loop
+
+IM1 = np.concatenate([[0.0, 0.09, 0.18, 0.27], np.geomspace(0.01, 5, 41)])
+IM2 = np.concatenate([[-1.0, 0.0, 10.0, 10.0], np.linspace(0.5, 80, 41)])
+
+
+def _both_paths(monkeypatch, func, *args, **kwargs):
+    monkeypatch.setattr(hazard, '_lq_prob_kernel', LQ_KERNEL)
+    monkeypatch.setattr(hazard, '_pgd_pdf_kernel', PGD_KERNEL)
+    kernel_res = func(*args, **kwargs)
+
+    monkeypatch.setattr(hazard, '_lq_prob_kernel', None)
+    monkeypatch.setattr(hazard, '_pgd_pdf_kernel', None)
+    numpy_res = func(*args, **kwargs)
+
+    return kernel_res, numpy_res
+
+
+@pytest.mark.parametrize('sc', range(6))
+def test_second_probability_kernel_matches_numpy(monkeypatch, sc):
+    kernel_res, numpy_res = _both_paths(monkeypatch, hazard.second_probability, IM1, sc=sc)
+    np.testing.assert_allclose(kernel_res, numpy_res, rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize('sc', range(6))
+def test_d_second_hazard_curve_kernel_matches_numpy(monkeypatch, sc):
+    kernel_res, numpy_res = _both_paths(monkeypatch, hazard.d_second_hazard_curve, IM1, IM2, sc=sc)
+    assert np.all(np.isfinite(kernel_res))
+    np.testing.assert_allclose(kernel_res, numpy_res, rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize('im1', [0.3, np.full((2, 3), 0.3)])
+def test_second_probability_shapes(monkeypatch, im1):
+    kernel_res, numpy_res = _both_paths(monkeypatch, hazard.second_probability, im1)
+    assert np.shape(kernel_res) == np.shape(numpy_res) == np.shape(im1)
+    np.testing.assert_allclose(kernel_res, numpy_res, rtol=1e-12, atol=0)
+
+
+def test_d_second_hazard_curve_outside_support(monkeypatch):
+    im1, im2 = np.array([0.3, 0.3]), np.array([0.0, -1.0])
+    kernel_res, numpy_res = _both_paths(monkeypatch, hazard.d_second_hazard_curve, im1, im2)
+    np.testing.assert_array_equal(kernel_res, [0.0, 0.0])
+    np.testing.assert_array_equal(numpy_res, [0.0, 0.0])
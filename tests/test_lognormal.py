@@ -0,0 +1,47 @@
+import numpy as np
+from scipy.stats import lognorm
+
+from pyRiskTable.lognormal import lognorm_cdf, lognorm_pdf, lognorm_ppf
+from pyRiskTable.example.constants import RATE
+from pyRiskTable.example.hazard import hazard_curve, hazard_likelihood
+
+
+S = 0.6
+XS = np.array([-0.5, 0.0, 1e-3, 0.1, 0.5, 1.0, 2.5])
+SCALES = np.array([0.3, 0.5, 0.7, 1.0, 1.2, 1.5, 2.0])
+
+
+def test_lognorm_cdf_pdf_match_scipy():
+    for x in [0.4, XS]:
+        np.testing.assert_allclose(lognorm_cdf(x, S, scale=0.5), lognorm.cdf(x, S, scale=0.5))
+        np.testing.assert_allclose(lognorm_pdf(x, S, scale=0.5), lognorm.pdf(x, S, scale=0.5))
+    assert np.ndim(lognorm_cdf(0.4, S)) == 0
+    assert np.ndim(lognorm_pdf(0.4, S)) == 0
+
+
+def test_lognorm_cdf_pdf_array_scale():
+    np.testing.assert_allclose(lognorm_cdf(XS, S, scale=SCALES), lognorm.cdf(XS, S, scale=SCALES))
+    np.testing.assert_allclose(lognorm_pdf(XS, S, scale=SCALES), lognorm.pdf(XS, S, scale=SCALES))
+    # broadcast one IM against several medians
+    np.testing.assert_allclose(lognorm_cdf(0.8, S, scale=SCALES), lognorm.cdf(0.8, S, scale=SCALES))
+
+
+def test_lognorm_outside_support():
+    x = np.array([-1.0, -1e-6, 0.0])
+    np.testing.assert_array_equal(lognorm_cdf(x, S), 0.0)
+    np.testing.assert_array_equal(lognorm_pdf(x, S), 0.0)
+    assert lognorm_cdf(0.0, S) == 0.0
+    assert lognorm_pdf(-0.1, S) == 0.0
+
+
+def test_lognorm_ppf_match_scipy():
+    qs = np.array([1e-4, 0.1, 0.5, 0.9, 0.9999])
+    np.testing.assert_allclose(lognorm_ppf(0.3, S, scale=0.5), lognorm.ppf(0.3, S, scale=0.5))
+    np.testing.assert_allclose(lognorm_ppf(qs, S, scale=0.5), lognorm.ppf(qs, S, scale=0.5))
+    np.testing.assert_allclose(lognorm_ppf(qs, S, scale=SCALES[:5]), lognorm.ppf(qs, S, scale=SCALES[:5]))
+    np.testing.assert_allclose(lognorm_cdf(lognorm_ppf(qs, S, scale=0.5), S, scale=0.5), qs)
+
+
+def test_example_hazard_at_zero_im():
+    assert hazard_likelihood(0.0) == 0
+    assert hazard_curve(-0.1) == RATE
@@ -0,0 +1,26 @@
+import numpy as np
+
+from pyRiskTable.risk import lognormal_expected_consequence
+
+
+MEDIANS = np.array([[0.30, 0.36, 0.49, 0.71], [0.45, 0.60, 0.80, 1.10]])
+DISPERSIONS = np.array([0.6, 0.5])
+CQ_ARRAYS = np.array([[0.12, 0.19, 0.48, 1.00], [12.0, 19.0, 48.0, 100.0]])
+
+
+def test_lognormal_expected_consequence_batch_matches_single():
+    ims = np.array([[0.1, 0.5, 1.0], [0.2, 0.7, 1.5]])
+    risk = lognormal_expected_consequence(ims, MEDIANS, DISPERSIONS, CQ_ARRAYS)
+    assert risk.shape == (2, 3)
+    for i in range(2):
+        np.testing.assert_allclose(
+            risk[i], lognormal_expected_consequence(ims[i], MEDIANS[i], DISPERSIONS[i], CQ_ARRAYS[i]))
+
+
+def test_lognormal_expected_consequence_scalar_im():
+    risk = lognormal_expected_consequence(1.0, MEDIANS, DISPERSIONS, CQ_ARRAYS)
+    assert risk.shape == (2,)
+    for i in range(2):
+        single = lognormal_expected_consequence(1.0, MEDIANS[i], DISPERSIONS[i], CQ_ARRAYS[i])
+        assert np.ndim(single) == 0
+        np.testing.assert_allclose(risk[i], single)
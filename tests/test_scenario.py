@@ -0,0 +1,94 @@
+import math
+
+import numpy as np
+import pytest
+
+from pyRiskTable.example.hazard import hazard_likelihood, im2d_likelihood
+from pyRiskTable.scenario import generate_primary_event, generate_secondary_event, _vectorize
+
+
+def _clamp_inplace(im, cap):
+    im[im > cap] = cap    # modifies the IMs passed by the quadrature
+    return im
+
+
+def test_primary_event_allows_inplace_callback():
+    ims, scalers, likes, cqs, val, err = generate_primary_event(
+        0.1, 2.0, likelihood_func=hazard_likelihood, vec_likelihood=True,
+        consequence_func=_clamp_inplace, kw_consequence={'cap': 1.0}, vec_consequence=True,
+        min_order=10, max_order=10)
+    assert np.all(cqs <= 1.0)
+    assert ims.flags.writeable and scalers.flags.writeable
+
+
+def test_secondary_event_allows_inplace_callback():
+    kwargs = dict(likelihood_func=im2d_likelihood, vec_likelihood=True,
+                  consequence_func=_clamp_inplace, kw_consequence={'cap': 50.0}, vec_consequence=True,
+                  min_order=6, max_order=6)
+    im, scaler, likes, cqs, val, err = generate_secondary_event(0.1, 2.0, 0.5, 80.0, **kwargs)
+    assert np.all(cqs <= 50.0)
+    assert cqs.flags.writeable
+
+    # repeated calls with the same grid are not affected by the in-place changes
+    _, _, _, _, val_again, _ = generate_secondary_event(0.1, 2.0, 0.5, 80.0, **kwargs)
+    assert val_again == val
+
+
+class _CountCalls:
+    def __init__(self, func):
+        self.func = func
+        self.n_calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.n_calls += 1
+        return self.func(*args, **kwargs)
+
+
+IMS = np.array([0.1, 0.5, 1.0])
+
+
+def test_vectorize_detects_vectorized_func():
+    func = _CountCalls(lambda im, k: k*np.exp(im))
+    vfunc = _vectorize(func, {'k': 2.0})
+    np.testing.assert_allclose(vfunc(IMS), 2.0*np.exp(IMS))
+    np.testing.assert_allclose(vfunc(IMS), 2.0*np.exp(IMS))
+    assert func.n_calls == 2
+
+
+def test_vectorize_falls_back_for_scalar_func():
+    func = _CountCalls(lambda im, k: k*math.exp(im) if im > 0.2 else 0.0)
+    vfunc = _vectorize(func, {'k': 2.0})
+    expected = [0.0, 2.0*math.exp(0.5), 2.0*math.exp(1.0)]
+    np.testing.assert_allclose(vfunc(IMS), expected)
+    assert func.n_calls == 1 + len(IMS)    # failed array call, then element-wise
+    np.testing.assert_allclose(vfunc(IMS), expected)
+    assert func.n_calls == 1 + 2*len(IMS)    # decision is reused
+
+
+def test_vectorize_falls_back_on_shape_mismatch():
+    func = _CountCalls(lambda im1, im2: float(np.sum(im1*im2)))
+    vfunc = _vectorize(func, {})
+    np.testing.assert_allclose(vfunc(IMS, IMS), IMS*IMS)
+    np.testing.assert_allclose(vfunc(IMS, IMS), IMS*IMS)
+    assert func.n_calls == 1 + 2*len(IMS)
+
+
+def test_vectorize_does_not_swallow_other_errors():
+    def func(im):
+        if np.ndim(im) > 0:
+            raise RuntimeError("bug on arrays")    # must not silently switch to element-wise
+        return im
+
+    with pytest.raises(RuntimeError, match="bug on arrays"):
+        _vectorize(func, {})(IMS)
+
+
+def test_vectorize_chains_array_error():
+    def func(im):
+        if np.ndim(im) > 0:
+            raise ValueError("array error")
+        raise TypeError("scalar error")
+
+    with pytest.raises(TypeError, match="scalar error") as excinfo:
+        _vectorize(func, {})(IMS)
+    assert isinstance(excinfo.value.__cause__, ValueError)
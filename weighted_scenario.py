@@ -1,19 +1,61 @@
 # %%
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 import geopandas as gpd
 
-from pyRiskTable.tools import fragility_curve, user_hazard_likelihood
-from pyRiskTable.scenario import generate_primary_event
-from pyRiskTable.risk import expected_consequence
+from pyRiskTable.tools import user_hazard_likelihood
+from pyRiskTable.scenario import generate_primary_events
+from pyRiskTable.risk import lognormal_expected_consequence
 from pyRiskTable.tools import export_primary_scenarios
 from pyRiskTable.example.constants import CQ_S, CQ_M, CQ_E, CQ_C
 
 
+def read_bridge(bridge_id, result_folder):
+    """Import the USGS hazard curve and HAZUS fragility parameters of a bridge and create the hazard likelihood.
+    Return None (and report the error) if the inputs of the bridge cannot be read or are malformed."""
+    try:
+        hazard_df = pd.read_csv(f"./USGS-data/Sa1_{bridge_id}.csv")
+        im_arr = hazard_df['Ground Motion (g)'].to_numpy()
+        rate_arr = hazard_df['Annual Frequency of Exceedence'].to_numpy()
+
+        # create interpolated hazard curves
+        # The last exceed could be NaN, rn it's handled by
+        # extrapolation default of cubic spline ('not-a-knot')
+        hazard_func = user_hazard_likelihood(
+            (im_arr, rate_arr),
+            like_type='exceedence',
+            method='cubic_spline', space='log',
+        )
+        # USGS ground motions are sorted in ascending order
+        im_lb, im_ub = im_arr[0], im_arr[-1]
+
+        fragility_df = pd.read_csv(f"./{result_folder}/{bridge_id}/hazus-fragility.csv")
+        medians = fragility_df[['Slight', 'Moderate', 'Extensive', 'Complete']].to_numpy().ravel()
+        dispersion = fragility_df['Dispersion'].to_numpy()[0]
+    except (OSError, KeyError, IndexError, ValueError, AssertionError) as e:
+        print(f"Bridge {bridge_id} skipped: {type(e).__name__}: {e}")
+        return None
+
+    return hazard_func, im_lb, im_ub, medians, dispersion
+
+
+def export_bridge(bridge_id, result_folder, ims, scalers, likes, cqs, hazard_func):
+    """Save the weighted scenarios of a bridge."""
+    os.makedirs(f"./{result_folder}/{bridge_id}", exist_ok=True)
+    filepath = os.path.join(f"./{result_folder}/{bridge_id}", "scenarios.csv")
+    export_primary_scenarios(
+        ims, scalers, likes, cqs,
+        hazard_curve=hazard_func,
+        vec_func=True, filepath=filepath
+    )
+
+
 if __name__ == "__main__":
     result_folder = 'OR-data'
-    nsc_min, nsc_max = 10, 10
+    nsc = 10    # Gauss-Legendre order shared by all bridges
     cq_ratio_array = np.array([CQ_S, CQ_M, CQ_E, CQ_C])
     
     # import bridge id
@@ -30,72 +72,68 @@ if __name__ == "__main__":
     # index = bridge_info[bridge_info['8 - Structure Number'] == '08083A006 35617'].index[0]
     # bridge_info = bridge_info.iloc[(index+1):]
 
-    risk_df = pd.DataFrame(columns=[
-        'Structure Number', 'Deck Area (sq. ft.)',
-        'Risk (sq. ft.)', 'Risk (ratio)'
-    ])
-
-    for index, row in bridge_info.iterrows():
-        bridge_id = row['8 - Structure Number'].strip()
-        deck_area = row['CAT29 - Deck Area (sq. ft.)']
-        cq_array = deck_area * cq_ratio_array
-
-        # import hazard curves and create interpolated curves
-        # The last exceed could be NaN, rn it's handled by
-        # extrapolation default of cubic spline ('not-a-knot')
-        hazard_df = pd.read_csv(f"./USGS-data/Sa1_{bridge_id}.csv")
-        
-        hazard_func = user_hazard_likelihood(
-            hazard_df,
-            im_key='Ground Motion (g)',
-            like_key='Annual Frequency of Exceedence',
-            like_type='exceedence',
-            method='cubic_spline', space='log',
-        )
-        
-        # import fragility parameters and create fragility models
-        fragility_df = pd.read_csv(f"./{result_folder}/{bridge_id}/hazus-fragility.csv")
-        m1, m2, m3, m4 = fragility_df[['Slight', 'Moderate', 'Extensive', 'Complete']].values.ravel()
-        d = fragility_df['Dispersion'].values[0]
-
-        fragility1_func = fragility_curve(m1, d)
-        fragility2_func = fragility_curve(m2, d)
-        fragility3_func = fragility_curve(m3, d)
-        fragility4_func = fragility_curve(m4, d)
-
-        # generate scenarios and estimate risk
-        im_lb, im_ub = hazard_df['Ground Motion (g)'].min(), hazard_df['Ground Motion (g)'].max()
-
-        ims, scalers, likes, cqs, val, err = generate_primary_event(im_lb, im_ub,
-            likelihood_func=hazard_func, kw_likelihood={}, vec_likelihood=True,
-            consequence_func=expected_consequence,
-            kw_consequence={
-                'fragility_funcs': [fragility1_func, fragility2_func,
-                                    fragility3_func, fragility4_func],
-                'cq_array': cq_array
-            },
-            vec_consequence=True,
-            rtol=0.05, min_order=nsc_min, max_order=nsc_max)
-
-        print(f'The estimated risk = {val}')
-
-        # save scnarios
-        os.makedirs(f"./{result_folder}/{bridge_id}", exist_ok=True)
-        filepath = os.path.join(f"./{result_folder}/{bridge_id}", "scenarios.csv")
-        export_primary_scenarios(
-            ims, scalers, likes, cqs,
-            hazard_curve=hazard_func,
-            vec_func=True, filepath=filepath
-        )
-        print(f"Bridge {bridge_id} scenarios saved")
-
-        # append to risk_df
-        risk_df.loc[index, 'Structure Number'] = bridge_id
-        risk_df.loc[index, 'Deck Area (sq. ft.)'] = deck_area
-        risk_df.loc[index, 'Risk (sq. ft.)'] = val
-        risk_df.loc[index, 'Risk (ratio)'] = val/deck_area
+    bridge_ids = bridge_info['8 - Structure Number'].str.strip().to_numpy(dtype=object)
+    deck_areas = bridge_info['CAT29 - Deck Area (sq. ft.)'].to_numpy(dtype=np.float64)
+
+    # import inputs of all bridges (file I/O, so threads are enough)
+    with ThreadPoolExecutor() as executor:
+        bridge_inputs = list(executor.map(lambda bridge_id: read_bridge(bridge_id, result_folder), bridge_ids))
+
+    # keep bridges whose inputs were read; skipped bridges are reported by read_bridge
+    is_read = np.array([inputs is not None for inputs in bridge_inputs], dtype=bool)
+    bridge_inputs = [inputs for inputs in bridge_inputs if inputs is not None]
+    bridge_ids, deck_areas = bridge_ids[is_read], deck_areas[is_read]
+    print(f"{is_read.sum()} of {len(is_read)} bridges read, {(~is_read).sum()} skipped")
+
+    n_bridge = len(bridge_ids)
+    if n_bridge == 0:
+        sys.exit("No bridge has readable inputs, nothing to evaluate")
+
+    cq_arrays = deck_areas[:, np.newaxis] * cq_ratio_array
+
+    medians = np.empty((n_bridge, len(cq_ratio_array)), dtype=np.float64)
+    dispersions = np.empty(n_bridge, dtype=np.float64)
+    im_lbs = np.empty(n_bridge, dtype=np.float64)
+    im_ubs = np.empty(n_bridge, dtype=np.float64)
+    hazard_funcs = []
+
+    for i, (hazard_func, im_lb, im_ub, bridge_medians, dispersion) in enumerate(bridge_inputs):
+        hazard_funcs.append(hazard_func)
+        im_lbs[i], im_ubs[i] = im_lb, im_ub
+        medians[i] = bridge_medians
+        dispersions[i] = dispersion
+
+    # generate scenarios and estimate risk of all bridges
+    # (hazard curves differ by bridge, fragility and consequences are evaluated in one call)
+    ims, scalers, likes, cqs, risks = generate_primary_events(im_lbs, im_ubs,
+        likelihood_func=lambda ims: np.array([func(im) for func, im in zip(hazard_funcs, ims)]),
+        consequence_func=lognormal_expected_consequence,
+        kw_consequence={
+            'medians': medians,
+            'dispersion': dispersions,
+            'cq_array': cq_arrays
+        },
+        order=nsc)
+
+    # save scnarios
+    with ThreadPoolExecutor() as executor:
+        saved = executor.map(
+            lambda i: export_bridge(bridge_ids[i], result_folder,
+                                    ims[i], scalers[i], likes[i], cqs[i], hazard_funcs[i]),
+            range(n_bridge))
+
+        # results are yielded in order once each file is written
+        for i, _ in enumerate(saved):
+            print(f'The estimated risk = {risks[i]}')
+            print(f"Bridge {bridge_ids[i]} scenarios saved")
 
     # save risk_df
-    risk_df.to_csv("./{result_folder}/risk-summary.csv", index=False)
+    risk_df = pd.DataFrame({
+        'Structure Number': bridge_ids,
+        'Deck Area (sq. ft.)': deck_areas,
+        'Risk (sq. ft.)': risks,
+        'Risk (ratio)': risks/deck_areas,
+    })
+    risk_df.to_csv(f"./{result_folder}/risk-summary.csv", index=False)
 
 # %%